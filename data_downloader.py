@@ -11,26 +11,60 @@ Usage:
     python download_data.py
 """
 
+import contextlib
 import os
+import queue
+import struct
+import threading
 import requests
 import zipfile
-import json
+import zlib
+import ijson
+from datasketch import HyperLogLog
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def download_google_drive_file(file_id, destination):
+# Download chunk / write buffer size (1 MiB)
+CHUNK_SIZE = 1024 * 1024
+
+# Parallel ranged download: connections per file, and the smallest file worth splitting
+RANGE_WORKERS = 8
+RANGE_MIN_SIZE = 8 * CHUNK_SIZE
+
+# Zip record signatures used by the streaming extractor
+ZIP_LOCAL_HEADER = b'PK\x03\x04'
+ZIP_DATA_DESCRIPTOR = b'PK\x07\x08'
+ZIP_CENTRAL_DIRECTORY = b'PK\x01\x02'
+ZIP_END_OF_CENTRAL_DIRECTORY = b'PK\x05\x06'
+
+class StreamingZipError(Exception):
+    """Raised when a zip archive cannot be extracted from a forward-only stream."""
+
+class RangeDownloadError(Exception):
+    """Raised when the server does not honour a ranged download."""
+
+def _new_session():
+    """Create a requests session whose connection pool fits RANGE_WORKERS connections."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=RANGE_WORKERS, pool_maxsize=RANGE_WORKERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def _open_google_drive_stream(session, file_id):
     """
-    Download a file from Google Drive using the file ID.
+    Open a streaming response for a Google Drive file.
     
     Args:
+        session (requests.Session): Session to issue the requests on
         file_id (str): The Google Drive file ID
-        destination (str): Local path to save the file
+    
+    Returns:
+        requests.Response: Response with the file content, not yet read
     """
     
     # Google Drive direct download URL
     url = f"https://drive.google.com/uc?id={file_id}&export=download"
     
-    print(f"Downloading file to {destination}...")
-    
-    session = requests.Session()
     response = session.get(url, stream=True)
     
     # Handle the download confirmation for large files
@@ -40,14 +74,115 @@ def download_google_drive_file(file_id, destination):
             response = session.get(url, params=params, stream=True)
             break
     
+    return response
+
+def download_google_drive_file(file_id, destination):
+    """
+    Download a file from Google Drive using the file ID.
+    
+    Args:
+        file_id (str): The Google Drive file ID
+        destination (str): Local path to save the file
+    """
+    
+    print(f"Downloading file to {destination}...")
+    
+    session = _new_session()
+    response = _open_google_drive_stream(session, file_id)
+    
+    # Large files are fetched as parallel byte ranges when the server allows it
+    total_size = int(response.headers.get('Content-Length', 0))
+    supports_ranges = (
+        response.headers.get('Accept-Ranges') == 'bytes' and
+        response.headers.get('Content-Encoding', 'identity') == 'identity'
+    )
+    
+    if supports_ranges and total_size >= RANGE_MIN_SIZE:
+        response.close()
+        try:
+            _download_ranges(session, response.url, destination, total_size)
+            print(f"Download completed: {destination}")
+            return
+        except RangeDownloadError as e:
+            print(f"Parallel download not possible ({e}), downloading as a single stream")
+            response = session.get(response.url, stream=True)
+    
     # Save the file
-    with open(destination, "wb") as f:
-        for chunk in response.iter_content(chunk_size=32768):
-            if chunk:
-                f.write(chunk)
+    with open(destination, "wb", buffering=CHUNK_SIZE) as f:
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            f.write(chunk)
     
     print(f"Download completed: {destination}")
 
+def _download_range(session, url, destination, start, end, cancelled):
+    """
+    Download bytes [start, end) of url into the same offsets of destination.
+    
+    Each call opens its own file handle, so workers write without locking.
+    Returns early, leaving the range incomplete, once cancelled is set.
+    """
+    if cancelled.is_set():
+        return
+    
+    headers = {'Range': f'bytes={start}-{end - 1}', 'Accept-Encoding': 'identity'}
+    
+    with session.get(url, headers=headers, stream=True) as response:
+        if response.status_code != 206:
+            raise RangeDownloadError(f"server answered {response.status_code} to a range request")
+        
+        written = 0
+        with open(destination, "r+b", buffering=CHUNK_SIZE) as f:
+            f.seek(start)
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                if cancelled.is_set():
+                    return  # Another range failed; stop transferring
+                f.write(chunk)
+                written += len(chunk)
+    
+    if written != end - start:
+        raise RangeDownloadError(f"range {start}-{end - 1} returned {written} bytes")
+
+def _download_ranges(session, url, destination, total_size):
+    """
+    Download url into destination as RANGE_WORKERS parallel byte ranges.
+    
+    Args:
+        session (requests.Session): Session with a pool of RANGE_WORKERS connections
+        url (str): Resolved download URL
+        destination (str): Local path to save the file
+        total_size (int): File size in bytes
+    """
+    part_size = -(-total_size // RANGE_WORKERS)
+    ranges = [(start, min(start + part_size, total_size)) for start in range(0, total_size, part_size)]
+    
+    # Preallocate so every worker can write at its own offset
+    with open(destination, "wb") as f:
+        f.truncate(total_size)
+    
+    # The first failing range stops the others, so a fallback does not
+    # have to wait for (and pay for) the rest of the parallel transfer
+    cancelled = threading.Event()
+    
+    try:
+        with ThreadPoolExecutor(max_workers=RANGE_WORKERS) as executor:
+            futures = [
+                executor.submit(_download_range, session, url, destination, start, end, cancelled)
+                for start, end in ranges
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                cancelled.set()
+                for future in futures:
+                    future.cancel()
+                raise
+    except BaseException:
+        # The preallocated file has the full size, so a partial one would pass
+        # for a complete download; remove it once every worker has stopped
+        os.remove(destination)
+        raise
+
 def extract_zip_file(zip_path, extract_to):
     """
     Extract a zip file to a specified directory.
@@ -60,7 +195,240 @@ def extract_zip_file(zip_path, extract_to):
     print(f"Extracting {zip_path} to {extract_to}...")
     
     with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(extract_to)
+        members = zip_ref.namelist()
+        if len(members) <= 1:
+            zip_ref.extractall(extract_to)
+            print("Extraction completed")
+            return
+    
+    # zlib releases the GIL while inflating, so members can be extracted in
+    # parallel. ZipFile is not thread-safe, so each worker opens its own handle.
+    n_workers = min(len(members), os.cpu_count() or 1)
+    
+    def extract_shard(shard):
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            for name in shard:
+                try:
+                    zip_ref.extract(name, extract_to)
+                except FileExistsError:
+                    # Another worker created the same parent directory first
+                    zip_ref.extract(name, extract_to)
+    
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        list(executor.map(extract_shard, [members[i::n_workers] for i in range(n_workers)]))
+    
+    print("Extraction completed")
+
+class _ChunkStream:
+    """Forward-only reader over an iterator of byte chunks, with push-back."""
+    
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = b''
+    
+    def read(self, size):
+        """Read exactly size bytes, or fewer at the end of the stream."""
+        if len(self._buffer) < size:
+            parts = [self._buffer]
+            buffered = len(self._buffer)
+            while buffered < size:
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                parts.append(chunk)
+                buffered += len(chunk)
+            self._buffer = b''.join(parts)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+    
+    def read_chunk(self):
+        """Return whatever is buffered, or the next chunk if the buffer is empty."""
+        if self._buffer:
+            data, self._buffer = self._buffer, b''
+            return data
+        return next(self._chunks, b'')
+    
+    def push_back(self, data):
+        """Return unconsumed bytes to the front of the stream."""
+        self._buffer = data + self._buffer
+
+def _member_path(name, extract_to):
+    """Resolve an archive member name inside extract_to, dropping unsafe parts."""
+    name = os.path.splitdrive(name.replace('\\', '/'))[1]
+    parts = [part for part in name.split('/') if part not in ('', '.', '..')]
+    if not parts:
+        raise StreamingZipError(f"Invalid member name: {name!r}")
+    return os.path.join(extract_to, *parts)
+
+def _zip64_extra_sizes(extra):
+    """
+    Read the ZIP64 size record from a local header extra field.
+    
+    Returns:
+        tuple: (uncompressed_size, compressed_size), or None without a ZIP64 record
+    """
+    offset = 0
+    while offset + 4 <= len(extra):
+        header_id, size = struct.unpack_from('<HH', extra, offset)
+        if header_id == 0x0001:
+            if size < 16:
+                raise StreamingZipError("Truncated ZIP64 extra field")
+            return struct.unpack_from('<QQ', extra, offset + 4)
+        offset += 4 + size
+    return None
+
+def _stream_extract_zip(chunks, extract_to):
+    """
+    Extract a zip archive from an iterator of byte chunks as they arrive.
+    
+    Members are read from their local headers in archive order, so the
+    central directory at the end of the file is never needed. Deflated
+    members (with or without data descriptors) and stored members with
+    sizes in the local header are supported. Anything else, including
+    input that is not a zip archive, raises StreamingZipError.
+    
+    Args:
+        chunks (iterator): Byte chunks of the archive, in order
+        extract_to (str): Directory to extract to
+    """
+    
+    stream = _ChunkStream(chunks)
+    n_members = 0
+    
+    while True:
+        signature = stream.read(4)
+        if signature in (ZIP_CENTRAL_DIRECTORY, ZIP_END_OF_CENTRAL_DIRECTORY):
+            break  # All members have been read
+        if signature != ZIP_LOCAL_HEADER:
+            if n_members == 0:
+                raise StreamingZipError("Not a zip archive")
+            raise StreamingZipError(f"Unexpected record signature {signature!r}")
+        
+        header = signature + stream.read(26)
+        if len(header) < 30:
+            raise StreamingZipError("Truncated local file header")
+        
+        (_, _, flags, method, _, _, crc, compressed_size, _,
+         name_length, extra_length) = struct.unpack('<4s5H3I2H', header)
+        name = stream.read(name_length).decode('utf-8' if flags & 0x800 else 'cp437')
+        zip64_sizes = _zip64_extra_sizes(stream.read(extra_length))
+        zip64 = zip64_sizes is not None
+        if zip64 and compressed_size == 0xFFFFFFFF:
+            compressed_size = zip64_sizes[1]
+        has_descriptor = flags & 0x08
+        
+        if flags & 0x01:
+            raise StreamingZipError(f"Encrypted member: {name}")
+        
+        target = _member_path(name, extract_to)
+        is_dir = name.endswith('/')
+        os.makedirs(target if is_dir else os.path.dirname(target), exist_ok=True)
+        
+        # Directory entries may still carry a (tiny) body that must be consumed
+        with contextlib.nullcontext() if is_dir else open(target, 'wb', buffering=CHUNK_SIZE) as out:
+            if method == zipfile.ZIP_DEFLATED:
+                decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                actual_crc = 0
+                while not decompressor.eof:
+                    data = stream.read_chunk()
+                    if not data:
+                        raise StreamingZipError(f"Truncated member: {name}")
+                    inflated = decompressor.decompress(data)
+                    actual_crc = zlib.crc32(inflated, actual_crc)
+                    if out is not None:
+                        out.write(inflated)
+                stream.push_back(decompressor.unused_data)
+            elif method == zipfile.ZIP_STORED and not has_descriptor:
+                # Write each piece as it arrives rather than buffering the member
+                actual_crc = 0
+                remaining = compressed_size
+                while remaining:
+                    data = stream.read_chunk()
+                    if not data:
+                        raise StreamingZipError(f"Truncated member: {name}")
+                    if len(data) > remaining:
+                        stream.push_back(data[remaining:])
+                        data = data[:remaining]
+                    remaining -= len(data)
+                    actual_crc = zlib.crc32(data, actual_crc)
+                    if out is not None:
+                        out.write(data)
+            else:
+                raise StreamingZipError(f"Member cannot be streamed: {name}")
+        
+        # With a data descriptor the CRC follows the member data
+        if has_descriptor:
+            descriptor = stream.read(4)
+            if descriptor != ZIP_DATA_DESCRIPTOR:
+                stream.push_back(descriptor)
+            descriptor = stream.read(20 if zip64 else 12)
+            if len(descriptor) < (20 if zip64 else 12):
+                raise StreamingZipError(f"Truncated data descriptor: {name}")
+            crc = struct.unpack_from('<I', descriptor)[0]
+        
+        if actual_crc != crc:
+            raise StreamingZipError(f"CRC mismatch in member: {name}")
+        
+        n_members += 1
+    
+    if n_members == 0:
+        raise StreamingZipError("Archive contains no members")
+
+def download_and_extract_zip(file_id, destination, extract_to):
+    """
+    Download a zip file from Google Drive and extract it while it downloads.
+    
+    The archive is written to destination as chunks arrive, and a worker
+    thread inflates the same chunks into extract_to, so the network and
+    decompression stages overlap. If the archive cannot be extracted from
+    a stream, it is extracted from destination once the download finishes.
+    
+    Args:
+        file_id (str): The Google Drive file ID
+        destination (str): Local path to save the zip file
+        extract_to (str): Directory to extract to
+    """
+    
+    print(f"Downloading {destination} and extracting to {extract_to}...")
+    
+    response = _open_google_drive_stream(_new_session(), file_id)
+    chunks = queue.Queue(maxsize=16)
+    
+    def queued_chunks():
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            yield chunk
+    
+    def extract_worker():
+        stream = queued_chunks()
+        try:
+            _stream_extract_zip(stream, extract_to)
+        finally:
+            # Keep draining so the download loop never blocks on a full queue
+            for _ in stream:
+                pass
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        extraction = executor.submit(extract_worker)
+        
+        try:
+            with open(destination, "wb", buffering=CHUNK_SIZE) as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    f.write(chunk)
+                    chunks.put(chunk)
+        finally:
+            chunks.put(None)
+        
+        print(f"Download completed: {destination}")
+        
+        try:
+            extraction.result()
+        except StreamingZipError as e:
+            print(f"Streaming extraction not possible ({e}), extracting from file instead")
+            extract_zip_file(destination, extract_to)
+            return
     
     print("Extraction completed")
 
@@ -76,34 +444,50 @@ def validate_json_file(json_path):
     """
     
     try:
-        with open(json_path, 'r') as f:
-            data = json.load(f)
-        
-        if not isinstance(data, list):
-            print("Error: JSON should contain a list of transactions")
-            return False
-        
-        if len(data) == 0:
-            print("Error: JSON file is empty")
-            return False
-        
-        # Check required fields in first transaction
-        required_fields = ['from', 'functionName', 'timeStamp', 'value', 'blockNumber']
-        first_tx = data[0]
-        
-        missing_fields = [field for field in required_fields if field not in first_tx]
-        if missing_fields:
-            print(f"Error: Missing required fields: {missing_fields}")
-            return False
+        with open(json_path, 'rb') as f:
+            # Stream transactions one at a time instead of loading the whole list
+            events = ijson.parse(f)
+            _, event, _ = next(events, (None, None, None))
+            
+            if event != 'start_array':
+                print("Error: JSON should contain a list of transactions")
+                return False
+            
+            transactions = ijson.items(events, 'item')
+            first_tx = next(transactions, None)
+            
+            if first_tx is None:
+                print("Error: JSON file is empty")
+                return False
+            
+            # Check required fields in first transaction
+            required_fields = ['from', 'functionName', 'timeStamp', 'value', 'blockNumber']
+            
+            missing_fields = [field for field in required_fields if field not in first_tx]
+            if missing_fields:
+                print(f"Error: Missing required fields: {missing_fields}")
+                return False
+            
+            # Wallet addresses are estimated with HyperLogLog (~1% error, ~16 KB)
+            # instead of an exact set; the handful of function names stays exact
+            n_transactions = 1
+            wallets = HyperLogLog(p=14)
+            wallets.update(first_tx['from'].encode())
+            functions = {first_tx['functionName']}
+            
+            for tx in transactions:
+                n_transactions += 1
+                wallets.update(tx['from'].encode())
+                functions.add(tx['functionName'])
         
         print(f"JSON file validated successfully!")
-        print(f"- Total transactions: {len(data)}")
-        print(f"- Unique wallets: {len(set(tx['from'] for tx in data))}")
-        print(f"- Unique functions: {len(set(tx['functionName'] for tx in data))}")
+        print(f"- Total transactions: {n_transactions}")
+        print(f"- Unique wallets: ~{round(wallets.count())}")
+        print(f"- Unique functions: {len(functions)}")
         
         return True
         
-    except json.JSONDecodeError:
+    except ijson.JSONError:
         print("Error: Invalid JSON format")
         return False
     except Exception as e:
@@ -149,13 +533,12 @@ def main():
     
     # Download the file
     try:
-        download_google_drive_file(file_id, filename)
-        
-        # If it's a zip file, extract it
+        # If it's a zip file, extract it while it downloads
         if filename.endswith('.zip'):
-            extract_zip_file(filename, '.')
+            download_and_extract_zip(file_id, filename, '.')
             json_filename = filename.replace('.zip', '.json')
         else:
+            download_google_drive_file(file_id, filename)
             json_filename = filename
         
         # Validate the JSON file
@@ -15,24 +15,70 @@ Requirements:
     - scikit-learn
     - matplotlib
     - seaborn
-    - json
+    - orjson
+    - pysimdjson
+    - numba
+    - pyarrow
 """
 
-import json
+import os
+import tempfile
+from pathlib import Path
+import orjson
+import simdjson
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import matplotlib
+matplotlib.use('Agg')  # Render to files only; no interactive window
 import matplotlib.pyplot as plt
 import seaborn as sns
 from sklearn.preprocessing import StandardScaler, RobustScaler
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.decomposition import PCA
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, r2_score
+from numba import njit
 import warnings
 warnings.filterwarnings('ignore')
 
+# Version of the frame load_data produces; bump whenever its projection,
+# coercion or dtypes change so stale Parquet caches are not reused
+PARSE_CACHE_VERSION = b'1'
+
+@njit(cache=True, fastmath=True)
+def _composite_score(repay_ratio, consistency, engagement, deposit_borrow, deposit_count,
+                     unique_functions, liquidation_count, clusters, weights, multipliers):
+    """
+    Compute clamped 0-1000 credit scores from the seven scoring components.
+    
+    weights follows the component order of the arguments; multipliers is
+    indexed by cluster label. Compiled once and cached on disk, so repeated
+    scoring runs (e.g. weight sweeps) avoid Python overhead entirely.
+    """
+    scores = np.empty(repay_ratio.shape[0])
+    
+    for i in range(repay_ratio.shape[0]):
+        weighted_score = (
+            weights[0] * min(1.0, repay_ratio[i] / 2.0) +         # Repayment behavior
+            weights[1] * consistency[i] +                         # Consistency
+            weights[2] * min(1.0, engagement[i] / 5.0) +          # Engagement
+            weights[3] * min(1.0, deposit_borrow[i] / 3.0) +      # Risk management
+            weights[4] * min(1.0, deposit_count[i] / 10.0) +      # Liquidity provision
+            weights[5] * min(1.0, unique_functions[i] / 5.0) +    # Protocol usage diversity
+            weights[6] * (1.0 if liquidation_count[i] == 0 else 0.0)  # No liquidations bonus
+        )
+        
+        # Apply cluster-based adjustment and clamp to valid range
+        final_score = weighted_score * multipliers[clusters[i]] * 1000
+        scores[i] = max(0.0, min(1000.0, final_score))
+    
+    return scores
+
 class DeFiCreditScorer:
     """
     A comprehensive credit scoring system for DeFi wallets based on Aave V2 transaction data.
@@ -46,29 +92,120 @@ class DeFiCreditScorer:
     """
     
     def __init__(self):
-        self.scaler = RobustScaler()
+        self.scaler = RobustScaler(copy=False)
         self.model = None
         self.feature_importance = None
         self.wallet_scores = {}
+        self.render_future = None
         
     def load_data(self, json_file_path):
-        """Load and parse JSON transaction data."""
+        """
+        Load and parse JSON transaction data.
+        
+        The parsed frame is cached next to the JSON file as Parquet, keyed on the
+        JSON file's size and modification time and on PARSE_CACHE_VERSION, and
+        reused while all three match.
+        """
         print("Loading transaction data...")
         
-        with open(json_file_path, 'r') as f:
-            data = json.load(f)
+        cache_path = Path(json_file_path).with_suffix('.parquet')
+        source_stat = os.stat(json_file_path)
+        cache_key = {
+            b'cache_version': PARSE_CACHE_VERSION,
+            b'source_size': str(source_stat.st_size).encode(),
+            b'source_mtime_ns': str(source_stat.st_mtime_ns).encode()
+        }
+        
+        df = self._read_parse_cache(cache_path, cache_key)
+        if df is not None:
+            print(f"Loaded {len(df)} transactions from {df['from'].nunique()} unique wallets (cached in {cache_path})")
+            return df
+        
+        with open(json_file_path, 'rb') as f:
+            raw = f.read()
+        
+        parser = simdjson.Parser()
+        try:
+            data = parser.parse(raw)
+        except RuntimeError:
+            # simdjson rejects integer literals wider than 64 bits (e.g. wei
+            # values written as JSON numbers); orjson reads those as floats
+            data = orjson.loads(raw)
+        
+        # Project only the fields used downstream straight into column arrays
+        # (gas fields are optional per row; missing ones become NaN on coercion)
+        columns = {
+            field: [tx[field] for tx in data]
+            for field in ['from', 'functionName', 'value', 'blockNumber']
+        }
+        for field in ['gasUsed', 'gasPrice']:
+            columns[field] = [tx.get(field) for tx in data]
+        columns['timeStamp'] = np.fromiter(
+            (int(tx['timeStamp']) for tx in data), dtype='int64', count=len(data)
+        )
+        del data  # release the parser's document before the parser itself
         
         # Convert to DataFrame
-        df = pd.DataFrame(data)
+        df = pd.DataFrame(columns)
         
         # Parse timestamps
         df['timestamp'] = pd.to_datetime(df['timeStamp'], unit='s')
         df['blockNumber'] = df['blockNumber'].astype(int)
-        df['value'] = df['value'].astype(float)
+        
+        # Numeric coercion once at load time rather than per aggregation
+        df['gasUsed'] = pd.to_numeric(df['gasUsed'], errors='coerce')
+        df['gasPrice'] = pd.to_numeric(df['gasPrice'], errors='coerce')
+        df['value'] = pd.to_numeric(df['value'], errors='coerce', downcast='float')
+        
+        # Low-cardinality string columns as categoricals (integer codes for groupby)
+        df['from'] = df['from'].astype('category')
+        df['functionName'] = df['functionName'].astype('category')
+        
+        self._write_parse_cache(df, cache_path, cache_key)
         
         print(f"Loaded {len(df)} transactions from {df['from'].nunique()} unique wallets")
         return df
     
+    def _read_parse_cache(self, cache_path, cache_key):
+        """Return the cached transaction frame if its key matches, else None."""
+        if not cache_path.exists():
+            return None
+        
+        try:
+            metadata = pq.read_schema(cache_path).metadata or {}
+            if any(metadata.get(key) != value for key, value in cache_key.items()):
+                return None  # Stale: the JSON file changed since the cache was written
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            print(f"Ignoring unreadable parse cache {cache_path}: {str(e)}")
+            return None
+    
+    def _write_parse_cache(self, df, cache_path, cache_key):
+        """
+        Write the transaction frame to the Parquet cache.
+        
+        The file is written under a temporary name in the same directory and
+        renamed into place, so an interrupted write never leaves a truncated
+        cache behind. Failures are reported and otherwise ignored.
+        """
+        tmp_path = None
+        
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=f".{cache_path.stem}.", suffix='.tmp.parquet', dir=cache_path.parent
+            )
+            os.close(fd)
+            
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), **cache_key})
+            pq.write_table(table, tmp_path, compression='zstd')
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Could not write parse cache {cache_path}: {str(e)}")
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
     def engineer_features(self, df):
         """
         Engineer comprehensive features for credit scoring.
@@ -82,79 +219,99 @@ class DeFiCreditScorer:
         """
         print("Engineering features...")
         
-        wallet_features = []
-        
-        for wallet in df['from'].unique():
-            wallet_txns = df[df['from'] == wallet].copy()
-            wallet_txns = wallet_txns.sort_values('timestamp')
-            
-            features = {'wallet': wallet}
-            
-            # Basic transaction metrics
-            features['total_transactions'] = len(wallet_txns)
-            features['unique_functions'] = wallet_txns['functionName'].nunique()
-            features['total_value_transacted'] = wallet_txns['value'].sum()
-            features['avg_transaction_value'] = wallet_txns['value'].mean()
-            features['median_transaction_value'] = wallet_txns['value'].median()
-            features['std_transaction_value'] = wallet_txns['value'].std()
-            
-            # Time-based features
-            time_span = (wallet_txns['timestamp'].max() - wallet_txns['timestamp'].min()).days
-            features['activity_span_days'] = max(1, time_span)
-            features['avg_transactions_per_day'] = features['total_transactions'] / features['activity_span_days']
-            
-            # Calculate time intervals between transactions
-            if len(wallet_txns) > 1:
-                time_diffs = wallet_txns['timestamp'].diff().dt.total_seconds() / 3600  # hours
-                features['avg_time_between_txns'] = time_diffs.mean()
-                features['std_time_between_txns'] = time_diffs.std()
-                features['consistency_score'] = 1 / (1 + features['std_time_between_txns'] / max(1, features['avg_time_between_txns']))
-            else:
-                features['avg_time_between_txns'] = 0
-                features['std_time_between_txns'] = 0
-                features['consistency_score'] = 0
-            
-            # Function-specific analysis
-            function_counts = wallet_txns['functionName'].value_counts()
-            
-            # Core DeFi behavior patterns
-            features['deposit_count'] = function_counts.get('deposit', 0)
-            features['borrow_count'] = function_counts.get('borrow', 0)
-            features['repay_count'] = function_counts.get('repay', 0)
-            features['redeem_count'] = function_counts.get('redeemUnderlying', 0)
-            features['liquidation_count'] = function_counts.get('liquidationCall', 0)
-            
-            # Calculate behavioral ratios
-            features['repay_to_borrow_ratio'] = features['repay_count'] / max(1, features['borrow_count'])
-            features['deposit_to_borrow_ratio'] = features['deposit_count'] / max(1, features['borrow_count'])
-            features['liquidation_rate'] = features['liquidation_count'] / features['total_transactions']
-            
-            # Risk indicators
-            features['is_frequent_borrower'] = 1 if features['borrow_count'] > 5 else 0
-            features['is_liquidated'] = 1 if features['liquidation_count'] > 0 else 0
-            features['high_value_user'] = 1 if features['total_value_transacted'] > wallet_txns['value'].quantile(0.8) else 0
-            
-            # Engagement depth
-            features['protocol_engagement_score'] = (
-                features['unique_functions'] * 0.3 +
-                min(features['total_transactions'] / 10, 5) * 0.4 +
-                features['activity_span_days'] / 365 * 0.3
-            )
-            
-            # Gas efficiency (proxy for sophistication)
-            features['avg_gas_used'] = wallet_txns['gasUsed'].astype(float).mean()
-            features['avg_gas_price'] = wallet_txns['gasPrice'].astype(float).mean()
-            features['gas_efficiency'] = features['avg_gas_used'] / max(1, features['avg_gas_price'])
-            
-            # Behavioral consistency
-            features['transaction_regularity'] = 1 / (1 + features['std_time_between_txns'] / 24)  # Normalize by 24 hours
-            
-            # Volume patterns
-            features['value_consistency'] = 1 / (1 + features['std_transaction_value'] / max(1, features['avg_transaction_value']))
-            
-            wallet_features.append(features)
+        # Sort once by wallet and time; grouped operations inherit this order
+        wallet_order = df['from'].unique()
+        df = df.sort_values(['from', 'timestamp'], kind='mergesort')
+        
+        # Basic transaction metrics (single pass over all wallets)
+        agg_df = df.groupby('from', sort=False, observed=True).agg(
+            total_transactions=('functionName', 'size'),
+            unique_functions=('functionName', 'nunique'),
+            total_value_transacted=('value', 'sum'),
+            avg_transaction_value=('value', 'mean'),
+            median_transaction_value=('value', 'median'),
+            std_transaction_value=('value', 'std'),
+            min_ts=('timestamp', 'min'),
+            max_ts=('timestamp', 'max'),
+            avg_gas_used=('gasUsed', 'mean'),
+            avg_gas_price=('gasPrice', 'mean')
+        )
+        
+        # Features are collected column-wise and assembled into a frame once
+        features = {
+            column: agg_df[column] for column in [
+                'total_transactions', 'unique_functions', 'total_value_transacted',
+                'avg_transaction_value', 'median_transaction_value', 'std_transaction_value'
+            ]
+        }
         
-        feature_df = pd.DataFrame(wallet_features)
+        # Time-based features
+        features['activity_span_days'] = (agg_df['max_ts'] - agg_df['min_ts']).dt.days.clip(lower=1)
+        features['avg_transactions_per_day'] = features['total_transactions'] / features['activity_span_days']
+        
+        # Calculate time intervals between transactions
+        # (rows are sorted by wallet, so one np.diff covers every wallet;
+        # diffs that cross a wallet boundary are masked out)
+        wallet_codes = df['from'].cat.codes.to_numpy()
+        time_diffs = np.diff(df['timestamp'].to_numpy()) / np.timedelta64(1, 'h')  # hours
+        time_diffs = np.where(wallet_codes[1:] == wallet_codes[:-1], time_diffs, np.nan)
+        time_stats = pd.Series(time_diffs).groupby(wallet_codes[1:]).agg(['mean', 'std'])
+        time_stats.index = df['from'].cat.categories[time_stats.index]
+        time_stats = time_stats.reindex(agg_df.index)
+        
+        # Wallets with a single transaction have no intervals
+        multi_txn = features['total_transactions'] > 1
+        features['avg_time_between_txns'] = time_stats['mean'].where(multi_txn, 0)
+        features['std_time_between_txns'] = time_stats['std'].where(multi_txn, 0)
+        features['consistency_score'] = (
+            1 / (1 + features['std_time_between_txns'] / features['avg_time_between_txns'].clip(lower=1))
+        ).where(multi_txn, 0)
+        
+        # Function-specific analysis: one (wallet x function) count table
+        tracked_functions = ['deposit', 'borrow', 'repay', 'redeemUnderlying', 'liquidationCall']
+        tracked_txns = df.loc[df['functionName'].isin(tracked_functions), ['from', 'functionName']]
+        function_counts = tracked_txns.groupby(['from', 'functionName'], sort=False, observed=True).size().unstack(
+            fill_value=0
+        ).reindex(index=agg_df.index, columns=tracked_functions, fill_value=0)
+        
+        # Core DeFi behavior patterns
+        features['deposit_count'] = function_counts['deposit']
+        features['borrow_count'] = function_counts['borrow']
+        features['repay_count'] = function_counts['repay']
+        features['redeem_count'] = function_counts['redeemUnderlying']
+        features['liquidation_count'] = function_counts['liquidationCall']
+        
+        # Calculate behavioral ratios
+        features['repay_to_borrow_ratio'] = features['repay_count'] / features['borrow_count'].clip(lower=1)
+        features['deposit_to_borrow_ratio'] = features['deposit_count'] / features['borrow_count'].clip(lower=1)
+        features['liquidation_rate'] = features['liquidation_count'] / features['total_transactions']
+        
+        # Risk indicators
+        features['is_frequent_borrower'] = (features['borrow_count'] > 5).astype(int)
+        features['is_liquidated'] = (features['liquidation_count'] > 0).astype(int)
+        global_p80 = df['value'].quantile(0.8)  # One threshold across all transactions
+        features['high_value_user'] = (features['total_value_transacted'] > global_p80).astype(int)
+        
+        # Engagement depth
+        features['protocol_engagement_score'] = (
+            features['unique_functions'] * 0.3 +
+            (features['total_transactions'] / 10).clip(upper=5) * 0.4 +
+            features['activity_span_days'] / 365 * 0.3
+        )
+        
+        # Gas efficiency (proxy for sophistication)
+        features['avg_gas_used'] = agg_df['avg_gas_used']
+        features['avg_gas_price'] = agg_df['avg_gas_price']
+        features['gas_efficiency'] = features['avg_gas_used'] / features['avg_gas_price'].clip(lower=1)
+        
+        # Behavioral consistency
+        features['transaction_regularity'] = 1 / (1 + features['std_time_between_txns'] / 24)  # Normalize by 24 hours
+        
+        # Volume patterns
+        features['value_consistency'] = 1 / (1 + features['std_transaction_value'] / features['avg_transaction_value'].clip(lower=1))
+        
+        # Restore first-seen wallet order
+        feature_df = pd.DataFrame(features).reindex(wallet_order).rename_axis('wallet').reset_index()
         
         # Handle missing values
         feature_df = feature_df.fillna(0)
@@ -172,13 +329,15 @@ class DeFiCreditScorer:
         print("Creating composite credit scores...")
         
         # Prepare features for scoring (exclude wallet address)
-        X = features_df.drop('wallet', axis=1)
+        X = features_df.drop('wallet', axis=1).to_numpy(dtype=np.float32, copy=False)
         
-        # Scale features
-        X_scaled = self.scaler.fit_transform(X)
+        # Scale features (float32 halves memory traffic for scaling and clustering)
+        X_scaled = self.scaler.fit_transform(X).astype(np.float32, copy=False)
         
         # Use clustering to identify behavioral patterns
-        kmeans = KMeans(n_clusters=5, random_state=42)
+        kmeans = MiniBatchKMeans(
+            n_clusters=5, batch_size=min(1024, X_scaled.shape[0]), n_init=3, random_state=42
+        )
         clusters = kmeans.fit_predict(X_scaled)
         
         # Define scoring components with weights
@@ -192,48 +351,22 @@ class DeFiCreditScorer:
             'no_liquidations': 0.05
         }
         
-        scores = []
-        
-        for idx, row in features_df.iterrows():
-            # Component scores (normalized 0-1)
-            components = {}
-            
-            # Repayment behavior (higher repay/borrow ratio is better)
-            components['repayment_behavior'] = min(1.0, row['repay_to_borrow_ratio'] / 2.0)
-            
-            # Consistency (regular transaction patterns)
-            components['consistency'] = row['consistency_score']
-            
-            # Engagement (diverse protocol usage)
-            components['engagement'] = min(1.0, row['protocol_engagement_score'] / 5.0)
-            
-            # Risk management (deposit/borrow ratio)
-            components['risk_management'] = min(1.0, row['deposit_to_borrow_ratio'] / 3.0)
-            
-            # Liquidity provision (deposit activity)
-            components['liquidity_provision'] = min(1.0, row['deposit_count'] / 10.0)
-            
-            # Protocol usage diversity
-            components['protocol_usage'] = min(1.0, row['unique_functions'] / 5.0)
-            
-            # No liquidations bonus
-            components['no_liquidations'] = 1.0 if row['liquidation_count'] == 0 else 0.0
-            
-            # Calculate weighted score
-            weighted_score = sum(
-                components[comp] * weight 
-                for comp, weight in scoring_components.items()
-            )
-            
-            # Apply cluster-based adjustment
-            cluster_multipliers = {0: 1.2, 1: 1.0, 2: 0.8, 3: 0.9, 4: 1.1}
-            cluster_adj = cluster_multipliers.get(clusters[idx], 1.0)
-            
-            # Final score (0-1000)
-            final_score = weighted_score * cluster_adj * 1000
-            final_score = max(0, min(1000, final_score))  # Clamp to valid range
-            
-            scores.append(final_score)
+        # Apply cluster-based adjustment
+        cluster_multipliers = np.array([1.2, 1.0, 0.8, 0.9, 1.1])
+        
+        # Final score (0-1000), components in scoring_components order
+        scores = _composite_score(
+            features_df['repay_to_borrow_ratio'].to_numpy(dtype=np.float64),
+            features_df['consistency_score'].to_numpy(dtype=np.float64),
+            features_df['protocol_engagement_score'].to_numpy(dtype=np.float64),
+            features_df['deposit_to_borrow_ratio'].to_numpy(dtype=np.float64),
+            features_df['deposit_count'].to_numpy(dtype=np.float64),
+            features_df['unique_functions'].to_numpy(dtype=np.float64),
+            features_df['liquidation_count'].to_numpy(dtype=np.float64),
+            clusters.astype(np.int64),
+            np.array(list(scoring_components.values())),
+            cluster_multipliers
+        )
         
         features_df['credit_score'] = scores
         
@@ -241,7 +374,7 @@ class DeFiCreditScorer:
         self.wallet_scores = dict(zip(features_df['wallet'], features_df['credit_score']))
         
         print(f"Generated credit scores for {len(features_df)} wallets")
-        print(f"Score distribution: Min={min(scores):.1f}, Max={max(scores):.1f}, Mean={np.mean(scores):.1f}")
+        print(f"Score distribution: Min={scores.min():.1f}, Max={scores.max():.1f}, Mean={scores.mean():.1f}")
         
         return features_df
     
@@ -251,26 +384,24 @@ class DeFiCreditScorer:
         """
         print("Analyzing credit score distribution...")
         
-        # Score ranges
-        ranges = [(0, 100), (100, 200), (200, 300), (300, 400), (400, 500), 
-                 (500, 600), (600, 700), (700, 800), (800, 900), (900, 1000)]
-        
-        range_analysis = {}
-        
-        for min_score, max_score in ranges:
-            range_wallets = scored_df[
-                (scored_df['credit_score'] >= min_score) & 
-                (scored_df['credit_score'] < max_score)
-            ]
-            
-            if len(range_wallets) > 0:
-                range_analysis[f"{min_score}-{max_score}"] = {
-                    'count': len(range_wallets),
-                    'avg_transactions': range_wallets['total_transactions'].mean(),
-                    'avg_repay_ratio': range_wallets['repay_to_borrow_ratio'].mean(),
-                    'avg_liquidation_rate': range_wallets['liquidation_rate'].mean(),
-                    'avg_engagement': range_wallets['protocol_engagement_score'].mean()
-                }
+        # Score ranges, bucketed in a single pass
+        bins = np.arange(0, 1001, 100)
+        buckets = pd.cut(
+            scored_df['credit_score'], bins=bins, right=False,
+            labels=[f"{b}-{b + 100}" for b in bins[:-1]]
+        )
+        
+        range_stats = scored_df.groupby(buckets, observed=True).agg(
+            count=('credit_score', 'size'),
+            avg_transactions=('total_transactions', 'mean'),
+            avg_repay_ratio=('repay_to_borrow_ratio', 'mean'),
+            avg_liquidation_rate=('liquidation_rate', 'mean'),
+            avg_engagement=('protocol_engagement_score', 'mean')
+        )
+        
+        range_analysis = {
+            str(bucket): stats for bucket, stats in range_stats.to_dict(orient='index').items()
+        }
         
         # Create visualizations
         self.create_visualizations(scored_df, range_analysis)
@@ -279,10 +410,18 @@ class DeFiCreditScorer:
     
     def create_visualizations(self, scored_df, range_analysis):
         """Create visualizations for score analysis."""
+        # Finish (and re-raise errors from) any earlier render before starting
+        # another, so two threads never write the same file at once
+        if self.render_future is not None:
+            future, self.render_future = self.render_future, None
+            future.result()
+        
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         
-        # Score distribution histogram
-        axes[0, 0].hist(scored_df['credit_score'], bins=50, alpha=0.7, color='skyblue')
+        # Score distribution histogram (binned by NumPy, drawn as bars)
+        hist_counts, bin_edges = np.histogram(scored_df['credit_score'], bins=50)
+        axes[0, 0].bar(bin_edges[:-1], hist_counts, width=np.diff(bin_edges), align='edge',
+                       alpha=0.7, color='skyblue')
         axes[0, 0].set_title('Credit Score Distribution')
         axes[0, 0].set_xlabel('Credit Score')
         axes[0, 0].set_ylabel('Number of Wallets')
@@ -310,9 +449,18 @@ class DeFiCreditScorer:
         axes[1, 1].set_xlabel('Repay to Borrow Ratio')
         axes[1, 1].set_ylabel('Credit Score')
         
-        plt.tight_layout()
-        plt.savefig('credit_score_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        # Rasterize and save in the background so it overlaps with save_results
+        # (errors surface from render_future.result() in save_results)
+        def render():
+            try:
+                fig.tight_layout()
+                fig.savefig('credit_score_analysis.png', dpi=120, bbox_inches='tight')
+            finally:
+                plt.close(fig)
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.render_future = executor.submit(render)
+        executor.shutdown(wait=False)
     
     def save_results(self, scored_df, range_analysis):
         """Save results to files."""
@@ -320,8 +468,13 @@ class DeFiCreditScorer:
         scored_df[['wallet', 'credit_score']].to_csv('wallet_credit_scores.csv', index=False)
         
         # Save detailed analysis
-        with open('score_analysis.json', 'w') as f:
-            json.dump(range_analysis, f, indent=2)
+        with open('score_analysis.json', 'wb') as f:
+            f.write(orjson.dumps(range_analysis, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        
+        # Wait for the plot started in create_visualizations (re-raises its errors)
+        if self.render_future is not None:
+            future, self.render_future = self.render_future, None
+            future.result()
         
         print("Results saved to:")
         print("- wallet_credit_scores.csv")
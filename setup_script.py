@@ -80,7 +80,13 @@ def verify_installation():
         "numpy",
         "sklearn",
         "matplotlib",
-        "seaborn"
+        "seaborn",
+        "orjson",
+        "ijson",
+        "datasketch",
+        "simdjson",
+        "numba",
+        "pyarrow"
     ]
     
     missing_packages = []
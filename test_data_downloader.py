@@ -0,0 +1,150 @@
+"""
+Round-trip tests for the streaming zip extractor in data_downloader.
+
+Archives are built in memory with zipfile, fed to the extractor in small
+chunks (so headers and deflate streams straddle chunk boundaries), and the
+extracted files are compared byte for byte with what was written.
+
+Usage:
+    python -m pytest test_data_downloader.py
+"""
+
+import io
+import os
+import zipfile
+
+import pytest
+
+import data_downloader
+from data_downloader import StreamingZipError, _stream_extract_zip
+
+PAYLOAD = os.urandom(50000) + b'{"from": "0xabc"}' * 20000
+
+class _Unseekable(io.RawIOBase):
+    """Write-only sink that forces zipfile to emit data descriptors."""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.buffer.write(data)
+
+def build_zip(members, compression=zipfile.ZIP_DEFLATED, seekable=True, force_zip64=False):
+    """Build a zip archive in memory from a {name: bytes} mapping."""
+    target = io.BytesIO() if seekable else _Unseekable()
+    with zipfile.ZipFile(target, 'w', compression) as zf:
+        for name, data in members.items():
+            if force_zip64:
+                with zf.open(name, 'w', force_zip64=True) as member:
+                    member.write(data)
+            else:
+                zf.writestr(name, data)
+    return target.getvalue() if seekable else target.buffer.getvalue()
+
+def chunked(data, size=4093):
+    """Split bytes into fixed-size chunks, like response.iter_content."""
+    return iter([data[i:i + size] for i in range(0, len(data), size)])
+
+def assert_extracted(extract_to, members):
+    for name, data in members.items():
+        path = os.path.join(extract_to, name)
+        if name.endswith('/'):
+            assert os.path.isdir(path)
+        else:
+            with open(path, 'rb') as f:
+                assert f.read() == data
+
+@pytest.mark.parametrize('compression', [zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED])
+def test_round_trip(tmp_path, compression):
+    members = {'user_transactions.json': PAYLOAD, 'nested/readme.txt': b'hello'}
+    _stream_extract_zip(chunked(build_zip(members, compression)), str(tmp_path))
+    assert_extracted(tmp_path, members)
+
+def test_stored_member_spanning_many_chunks(tmp_path):
+    data = os.urandom(5 * data_downloader.CHUNK_SIZE + 123)
+    members = {'user_transactions.json': data, 'other.txt': b'tail'}
+    archive = build_zip(members, zipfile.ZIP_STORED)
+    _stream_extract_zip(chunked(archive, data_downloader.CHUNK_SIZE), str(tmp_path))
+    assert_extracted(tmp_path, members)
+
+def test_truncated_stored_member_is_rejected(tmp_path):
+    archive = build_zip({'a.json': PAYLOAD}, zipfile.ZIP_STORED)
+    with pytest.raises(StreamingZipError, match="Truncated member"):
+        _stream_extract_zip(chunked(archive[:len(PAYLOAD) // 2]), str(tmp_path))
+
+def test_data_descriptor_round_trip(tmp_path):
+    members = {'user_transactions.json': PAYLOAD, 'other.txt': b'x' * 1000}
+    archive = build_zip(members, seekable=False)
+    assert zipfile.ZipFile(io.BytesIO(archive)).infolist()[0].flag_bits & 0x08
+    _stream_extract_zip(chunked(archive), str(tmp_path))
+    assert_extracted(tmp_path, members)
+
+@pytest.mark.parametrize('compression', [zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED])
+def test_zip64_round_trip(tmp_path, compression):
+    members = {'user_transactions.json': PAYLOAD, 'other.txt': b'y' * 1000}
+    _stream_extract_zip(chunked(build_zip(members, compression, force_zip64=True)), str(tmp_path))
+    assert_extracted(tmp_path, members)
+
+def test_zip64_data_descriptor_round_trip(tmp_path):
+    members = {'user_transactions.json': PAYLOAD, 'other.txt': b'z' * 1000}
+    archive = build_zip(members, seekable=False, force_zip64=True)
+    _stream_extract_zip(chunked(archive), str(tmp_path))
+    assert_extracted(tmp_path, members)
+
+def test_deflated_directory_entry(tmp_path):
+    # writestr('data/', b'') under ZIP_DEFLATED leaves a 2-byte deflate body
+    members = {'data/': b'', 'data/user_transactions.json': PAYLOAD}
+    _stream_extract_zip(chunked(build_zip(members)), str(tmp_path))
+    assert_extracted(tmp_path, members)
+
+def test_stored_member_with_descriptor_is_rejected(tmp_path):
+    archive = build_zip({'a.json': PAYLOAD}, zipfile.ZIP_STORED, seekable=False)
+    with pytest.raises(StreamingZipError):
+        _stream_extract_zip(chunked(archive), str(tmp_path))
+
+@pytest.mark.parametrize('body', [b'', b'<html><body>Quota exceeded</body></html>'])
+def test_non_zip_input_is_rejected(tmp_path, body):
+    with pytest.raises(StreamingZipError):
+        _stream_extract_zip(chunked(body), str(tmp_path))
+
+def test_trailing_garbage_is_rejected(tmp_path):
+    archive = build_zip({'a.json': PAYLOAD})
+    first_member_end = archive.index(b'PK\x01\x02')
+    with pytest.raises(StreamingZipError):
+        _stream_extract_zip(chunked(archive[:first_member_end] + b'garbage!'), str(tmp_path))
+
+def test_unsafe_member_names_stay_inside_target(tmp_path):
+    extract_to = tmp_path / 'out'
+    _stream_extract_zip(chunked(build_zip({'../evil.txt': b'no', '/abs.txt': b'no'})), str(extract_to))
+    assert not (tmp_path / 'evil.txt').exists()
+    assert (extract_to / 'evil.txt').read_bytes() == b'no'
+    assert (extract_to / 'abs.txt').read_bytes() == b'no'
+
+class _FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def iter_content(self, chunk_size):
+        return chunked(self.body, chunk_size)
+
+def test_download_and_extract_falls_back_for_stored_descriptor(tmp_path, monkeypatch):
+    members = {'user_transactions.json': PAYLOAD}
+    archive = build_zip(members, zipfile.ZIP_STORED, seekable=False)
+    monkeypatch.setattr(data_downloader, '_open_google_drive_stream',
+                        lambda session, file_id: _FakeResponse(archive))
+
+    destination = tmp_path / 'user_transactions.zip'
+    data_downloader.download_and_extract_zip('file-id', str(destination), str(tmp_path))
+
+    assert destination.read_bytes() == archive
+    assert_extracted(tmp_path, members)
+
+def test_download_and_extract_reports_non_zip_body(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_downloader, '_open_google_drive_stream',
+                        lambda session, file_id: _FakeResponse(b'<html>Quota exceeded</html>'))
+
+    with pytest.raises(zipfile.BadZipFile):
+        data_downloader.download_and_extract_zip('file-id', str(tmp_path / 'x.zip'), str(tmp_path))